@@ -1,8 +1,46 @@
 import base64
 import csv
 import io
+from collections import deque
+from functools import lru_cache
+
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
+from odoo.tools import split_every
+
+from psycopg2.extras import execute_values
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# Deletes currency noise ($ and thousands separators) in one C-level
+# pass, without the intermediate strings of chained replace(). Spaces
+# stay in so malformed cells like '1 000' still fail to parse, as
+# they always have (float() ignores leading/trailing whitespace).
+_PRICE_DROP = str.maketrans('', '', '$,')
+
+
+# The csv.reader fallback calls these once per cell; memoizing them lets
+# repeated barcodes and names short-circuit to the computed result (the
+# pandas path cleans whole columns at once and skips them entirely)
+@lru_cache(maxsize=8192)
+def _clean_barcode_cached(barcode_str):
+    return barcode_str.strip()
+
+
+@lru_cache(maxsize=8192)
+def _clean_name_cached(name_str):
+    return ' '.join(name_str.split())
+
+
+def _freeze(value):
+    """Return a hashable version of a vals value (lists become tuples),
+    so vals dicts can key a grouping dict."""
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
 
 
 class ProductImportWizard(models.TransientModel):
@@ -38,6 +76,10 @@ class ProductImportWizard(models.TransientModel):
     # Col 4: Product Category
     # Col 5: Point of Sale Category
     # Available in POS = TRUE by default for all products
+    # Rows processed (lookup, write, create) per chunk, so buffers and
+    # the prefetched maps stay bounded no matter how big the upload is
+    IMPORT_CHUNK_SIZE = 1000
+
     COL_NAME = 0          # Product Name
     COL_BARCODE = 1       # Barcode
     COL_UNIT_COST = 2     # Unit Cost
@@ -47,11 +89,10 @@ class ProductImportWizard(models.TransientModel):
 
     def _clean_price(self, price_str):
         """Remove $ and convert to float"""
-        if not price_str or price_str.strip() == '':
+        if not price_str:
             return None
-        cleaned = price_str.replace('$', '').replace(',', '').strip()
         try:
-            return float(cleaned)
+            return float(price_str.translate(_PRICE_DROP))
         except ValueError:
             return None
 
@@ -59,25 +100,34 @@ class ProductImportWizard(models.TransientModel):
         """Clean barcode - remove spaces"""
         if not barcode_str:
             return ''
-        return barcode_str.strip()
+        return _clean_barcode_cached(barcode_str)
 
     def _clean_name(self, name_str):
         """Clean product name - remove extra spaces"""
         if not name_str:
             return ''
-        return ' '.join(name_str.split())
+        return _clean_name_cached(name_str)
 
-    def _get_or_create_category(self, category_name):
-        """Get or create a product category by name (e.g., 'All / Grocery')"""
+    def _get_or_create_category(self, category_name, cache=None):
+        """Get or create a product category by name (e.g., 'All / Grocery').
+
+        ``cache`` maps cleaned names to ids for the duration of one
+        import, so rows repeating the same category cost a dict lookup
+        instead of a fresh search.
+        """
         if not category_name or not category_name.strip():
             return None
 
         category_name = category_name.strip()
+        if cache is not None and category_name in cache:
+            return cache[category_name]
         ProductCategory = self.env['product.category']
 
         # Search by complete name (includes parent path like "All / Grocery")
         category = ProductCategory.search([('complete_name', '=', category_name)], limit=1)
         if category:
+            if cache is not None:
+                cache[category_name] = category.id
             return category.id
 
         # If not found, try to create it
@@ -100,25 +150,136 @@ class ProductImportWizard(models.TransientModel):
                 })
                 parent_id = new_cat.id
 
+        if cache is not None:
+            cache[category_name] = parent_id
         return parent_id
 
-    def _get_or_create_pos_category(self, pos_category_name):
-        """Get or create a POS category by name"""
+    def _get_or_create_pos_category(self, pos_category_name, cache=None):
+        """Get or create a POS category by name.
+
+        ``cache`` plays the same role as in _get_or_create_category.
+        """
         if not pos_category_name or not pos_category_name.strip():
             return None
 
         pos_category_name = pos_category_name.strip()
+        if cache is not None and pos_category_name in cache:
+            return cache[pos_category_name]
         PosCategory = self.env['pos.category']
 
         # Search by name
         category = PosCategory.search([('name', '=', pos_category_name)], limit=1)
         if category:
+            if cache is not None:
+                cache[pos_category_name] = category.id
             return category.id
 
         # Create if not found
         new_cat = PosCategory.create({'name': pos_category_name})
+        if cache is not None:
+            cache[pos_category_name] = new_cat.id
         return new_cat.id
 
+    def _get_csv_data(self):
+        """Return the uploaded CSV as raw bytes.
+
+        Like po.import.wizard, reads the Binary field's filestore
+        attachment directly instead of base64-encoding and immediately
+        decoding the whole file.
+        """
+        attachment = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_field', '=', 'csv_file'),
+            ('res_id', '=', self.id),
+        ], limit=1)
+        if attachment:
+            return attachment.raw
+        return base64.b64decode(self.csv_file)
+
+    def _read_csv_dataframe(self, csv_data):
+        """Return the CSV as a pandas DataFrame, or None without pandas.
+
+        Same tiering as po.import.wizard: pyarrow engine, then the C
+        engine, both parsing the raw bytes without an intermediate str
+        copy. Returns None when pandas is unavailable or its tokenizer
+        rejects the file, letting the caller fall back to csv.reader.
+        """
+        if pd is None:
+            return None
+        bio = io.BytesIO(csv_data)
+        try:
+            return pd.read_csv(bio, engine='pyarrow', dtype=str,
+                               keep_default_na=False)
+        except (ImportError, ValueError):
+            # pyarrow missing, or it rejected the file
+            bio.seek(0)
+            try:
+                return pd.read_csv(bio, engine='c', dtype=str,
+                                   keep_default_na=False)
+            except (pd.errors.EmptyDataError, pd.errors.ParserError):
+                # Blank-only files raise EmptyDataError; the csv.reader
+                # fallback handles them gracefully
+                return None
+
+    def _parse_csv(self, csv_data):
+        """Parse and clean the CSV in one step.
+
+        Returns a list with one entry per data row: a (name, barcode,
+        unit_cost, sale_price, category_name, pos_category_name) tuple,
+        or None for rows too short to use. Prices are floats or None for
+        blank/unparseable cells, matching _clean_price. On the pandas
+        path the cleaning runs as vectorized column operations instead
+        of per-cell Python.
+        """
+        ncols = self.COL_POS_CATEGORY + 1
+        df = self._read_csv_dataframe(csv_data)
+        if df is not None:
+            empty = pd.Series('', index=df.index)
+            cols = [df.iloc[:, i] if i < df.shape[1] else empty
+                    for i in range(ncols)]
+
+            def clean_str(col):
+                return col.fillna('').astype(str).str.strip()
+
+            def clean_price(col):
+                num = pd.to_numeric(
+                    clean_str(col).str.replace(r'[$,]', '', regex=True),
+                    errors='coerce')
+                # None (not NaN) marks blank/bad cells, like _clean_price
+                return num.astype(object).where(num.notna(), None)
+
+            name = (cols[self.COL_NAME].fillna('').astype(str)
+                    .str.split().str.join(' '))
+            barcode = clean_str(cols[self.COL_BARCODE])
+            unit_cost = clean_price(cols[self.COL_UNIT_COST])
+            sale_price = clean_price(cols[self.COL_SALE_PRICE])
+            category = clean_str(cols[self.COL_CATEGORY])
+            pos_category = clean_str(cols[self.COL_POS_CATEGORY])
+            # tolist() yields plain Python str/float, as the ORM expects
+            return list(zip(name.tolist(), barcode.tolist(),
+                            unit_cost.tolist(), sale_price.tolist(),
+                            category.tolist(), pos_category.tolist()))
+
+        # TextIOWrapper decodes lazily as the reader pulls lines,
+        # instead of holding the bytes plus a full str copy at once
+        reader = csv.reader(io.TextIOWrapper(
+            io.BytesIO(csv_data), encoding='utf-8', newline=''))
+        next(reader, None)  # skip header row
+        parsed = []
+        for row in reader:
+            if len(row) < 2:  # At minimum need Name and Barcode
+                parsed.append(None)
+                continue
+            parsed.append((
+                self._clean_name(row[self.COL_NAME]),
+                self._clean_barcode(row[self.COL_BARCODE]),
+                self._clean_price(row[self.COL_UNIT_COST]) if len(row) > self.COL_UNIT_COST else None,
+                self._clean_price(row[self.COL_SALE_PRICE]) if len(row) > self.COL_SALE_PRICE else None,
+                row[self.COL_CATEGORY].strip() if len(row) > self.COL_CATEGORY else '',
+                row[self.COL_POS_CATEGORY].strip() if len(row) > self.COL_POS_CATEGORY else '',
+            ))
+        return parsed
+
     def action_import(self):
         """Import products from CSV"""
         self.ensure_one()
@@ -126,120 +287,338 @@ class ProductImportWizard(models.TransientModel):
         if not self.csv_file:
             raise UserError(_('Please upload a CSV file.'))
 
-        # Decode the CSV file
-        csv_data = base64.b64decode(self.csv_file)
-        csv_file = io.StringIO(csv_data.decode('utf-8'))
-        reader = csv.reader(csv_file)
-
-        # Skip header row
-        next(reader, None)
+        # Parse and clean the CSV (vectorized when pandas is available)
+        csv_data = self._get_csv_data()
+        parsed_csv = self._parse_csv(csv_data)
 
         # Statistics
         created = 0
         updated = 0
         skipped = 0
-        errors = []
+        # Only the first few errors are shown; the bounded deque keeps
+        # memory flat when most rows of a big file fail, while
+        # error_count reports the real total
+        errors = deque(maxlen=10)
+        error_count = 0
 
         ProductProduct = self.env['product.product']
 
-        for row_num, row in enumerate(reader, start=2):
-            try:
-                if len(row) < 2:  # At minimum need Name and Barcode
-                    skipped += 1
-                    continue
-
-                # Simple template columns
-                name = self._clean_name(row[self.COL_NAME])           # Col 0 - Product Name
-                barcode = self._clean_barcode(row[self.COL_BARCODE])  # Col 1 - Barcode
-                unit_cost = self._clean_price(row[self.COL_UNIT_COST]) if len(row) > self.COL_UNIT_COST else None  # Col 2
-                sale_price = self._clean_price(row[self.COL_SALE_PRICE]) if len(row) > self.COL_SALE_PRICE else None  # Col 3
-                category_name = row[self.COL_CATEGORY].strip() if len(row) > self.COL_CATEGORY else ''  # Col 4
-                pos_category_name = row[self.COL_POS_CATEGORY].strip() if len(row) > self.COL_POS_CATEGORY else ''  # Col 5
-                available_in_pos = True  # Default TRUE for all products
-
-                # Skip rows without barcode or name
-                if not barcode or not name:
-                    skipped += 1
-                    continue
-
-                # Get or create categories
-                categ_id = None
-                pos_categ_id = None
-
-                if self.update_category and category_name:
-                    categ_id = self._get_or_create_category(category_name)
-
-                if self.update_pos_category and pos_category_name:
-                    pos_categ_id = self._get_or_create_pos_category(pos_category_name)
-
-                # Search for existing product by barcode
-                existing_product = ProductProduct.search([('barcode', '=', barcode)], limit=1)
-
-                # Skip if barcode exists and skip_existing_barcode is checked
-                if existing_product and self.skip_existing_barcode:
-                    skipped += 1
-                    continue
-
-                if existing_product:
-                    # Update existing product
-                    vals = {}
-
-                    if self.update_name:
-                        vals['name'] = name
-
-                    if self.update_cost and unit_cost is not None:
-                        vals['standard_price'] = unit_cost
-
-                    if self.update_sale_price and sale_price is not None:
-                        vals['list_price'] = sale_price
-
-                    if self.update_purchase_desc:
-                        vals['description_purchase'] = f"Vendor: {self.vendor_name}"
-
-                    if self.update_category and categ_id:
-                        vals['categ_id'] = categ_id
-
-                    if self.update_pos_category and pos_categ_id:
-                        vals['pos_categ_ids'] = [(6, 0, [pos_categ_id])]
-
-                    # Update available_in_pos
-                    vals['available_in_pos'] = available_in_pos
+        # Pass 1: validate the cleaned rows up front; the category
+        # pre-resolution below works from the full parsed list
+        parsed_rows = []
+        for row_num, parsed in enumerate(parsed_csv, start=2):
+            if parsed is None:  # Row too short for Name and Barcode
+                skipped += 1
+                continue
+
+            (name, barcode, unit_cost, sale_price,
+             category_name, pos_category_name) = parsed
+
+            # Skip rows without barcode or name
+            if not barcode or not name:
+                skipped += 1
+                continue
+
+            parsed_rows.append({
+                'row_num': row_num,
+                'name': name,
+                'barcode': barcode,
+                'unit_cost': unit_cost,
+                'sale_price': sale_price,
+                'category_name': category_name,
+                'pos_category_name': pos_category_name,
+            })
+
+        # Pre-resolve every distinct category with one query per model
+        # and prime the caches, so the row loop is a pure dict lookup for
+        # anything that already exists; only missing product categories
+        # (which need the hierarchy walk) fall through to the resolver,
+        # once per unique name
+        categ_cache = {}
+        pos_categ_cache = {}
+        if self.update_category:
+            unique_categs = {p['category_name'] for p in parsed_rows
+                             if p['category_name']}
+            if unique_categs:
+                ProductCategory = self.env['product.category']
+                for cat in ProductCategory.search_read(
+                        [('complete_name', 'in', list(unique_categs))],
+                        ['complete_name']):
+                    categ_cache[cat['complete_name']] = cat['id']
+                # Resolve the missing paths here, walking them in sorted
+                # order with a shared prefix cache: each hierarchy node
+                # is searched or created exactly once even when many
+                # paths share a prefix like "All / Grocery"
+                prefix_ids = {}
+                for name in sorted(unique_categs - set(categ_cache)):
+                    parent_id = None
+                    prefix = ''
+                    for part in (p.strip() for p in name.split('/')):
+                        prefix = f'{prefix}/{part}' if prefix else part
+                        node_id = prefix_ids.get(prefix)
+                        if node_id is None:
+                            existing = ProductCategory.search([
+                                ('name', '=', part),
+                                ('parent_id', '=', parent_id),
+                            ], limit=1)
+                            node_id = existing.id or ProductCategory.create({
+                                'name': part,
+                                'parent_id': parent_id,
+                            }).id
+                            prefix_ids[prefix] = node_id
+                        parent_id = node_id
+                    categ_cache[name] = parent_id
+        if self.update_pos_category:
+            unique_pos_categs = {p['pos_category_name'] for p in parsed_rows
+                                 if p['pos_category_name']}
+            if unique_pos_categs:
+                PosCategory = self.env['pos.category']
+                for cat in PosCategory.search_read(
+                        [('name', 'in', list(unique_pos_categs))], ['name']):
+                    pos_categ_cache[cat['name']] = cat['id']
+                # POS categories are flat, so the missing ones can be
+                # created in a single batch
+                missing = sorted(unique_pos_categs - set(pos_categ_cache))
+                if missing:
+                    for cat in PosCategory.create([{'name': name} for name in missing]):
+                        pos_categ_cache[cat.name] = cat.id
+
+        # Hoist the per-row constants out of the loop: the wizard
+        # attribute reads go through the ORM field descriptors and the
+        # vendor description is the same string for every row
+        vendor_desc = f"Vendor: {self.vendor_name}"
+        skip_existing = self.skip_existing_barcode
+        create_new = self.create_new_products
+        upd_category = self.update_category
+        upd_pos_category = self.update_pos_category
+
+        # One distinct m2m command per POS category is enough; memoizing
+        # it avoids allocating a fresh list-of-tuple-of-list on every
+        # created row
+        pos_cmd_cache = {
+            pos_id: [(6, 0, [pos_id])] for pos_id in pos_categ_cache.values()
+        }
 
-                    if vals:
-                        existing_product.write(vals)
-                        updated += 1
+        # Specialize the update-vals builder on the wizard's flags once:
+        # the row loop then runs only the steps that are enabled instead
+        # of re-testing every update_* flag per row
+        update_steps = []
+        if self.update_name:
+            update_steps.append(
+                lambda vals, row: vals.__setitem__('name', row['name']))
+        if self.update_cost:
+            def _cost_step(vals, row):
+                if row['unit_cost'] is not None:
+                    vals['standard_price'] = row['unit_cost']
+            update_steps.append(_cost_step)
+        if self.update_sale_price:
+            def _sale_price_step(vals, row):
+                if row['sale_price'] is not None:
+                    vals['list_price'] = row['sale_price']
+            update_steps.append(_sale_price_step)
+        if self.update_purchase_desc:
+            update_steps.append(
+                lambda vals, row: vals.__setitem__(
+                    'description_purchase', vendor_desc))
+        if self.update_category:
+            def _categ_step(vals, row):
+                if row['categ_id']:
+                    vals['categ_id'] = row['categ_id']
+            update_steps.append(_categ_step)
+
+        # Pass 2: process the rows in bounded chunks. Each chunk gets
+        # its own barcode resolution, grouped writes and batched create,
+        # so peak memory and the write buffers scale with the chunk, not
+        # the file
+        for chunk in split_every(self.IMPORT_CHUNK_SIZE, parsed_rows, piece_maker=list):
+            # Resolve this chunk's barcodes in a single query.
+            # search_read returns plain dicts, skipping recordset
+            # construction for products that are never written
+            existing_map = {}
+            # Template ids for the m2m link rewrite below: pos_categ_ids
+            # lives on product.template
+            tmpl_by_product = {}
+            # Current field values per product, used to prune keys whose
+            # target value is already in place: a no-op write still costs
+            # an UPDATE plus recomputation of every dependent field
+            current_by_id = {}
+            # Keep the lowest id per barcode, like the old limit=1 searches
+            for rec in ProductProduct.search_read(
+                    [('barcode', 'in', [p['barcode'] for p in chunk])],
+                    ['barcode', 'product_tmpl_id', 'name', 'standard_price',
+                     'list_price', 'categ_id', 'available_in_pos',
+                     'description_purchase', 'pos_categ_ids'], order='id'):
+                existing_map.setdefault(rec['barcode'], rec['id'])
+                tmpl_by_product[rec['id']] = rec['product_tmpl_id'][0]
+                # Normalize for direct comparison against write vals
+                rec['categ_id'] = rec['categ_id'][0] if rec['categ_id'] else False
+                current_by_id[rec['id']] = rec
+
+            # Vals for new products, created in one multi-record call
+            # after the chunk's dispatch; queued_by_barcode catches a
+            # barcode appearing twice among the chunk's new rows, which
+            # would otherwise trip barcode_uniq and roll back the chunk
+            create_vals = []
+            queued_by_barcode = {}
+            # Updates grouped by identical vals (most rows share the same
+            # vendor description or category), written set-based: one
+            # UPDATE per distinct vals instead of one per product
+            update_groups = {}
+            # (template_id, pos_category_id) links, written straight into
+            # the m2m relation table in one statement; the (6, 0, ...)
+            # command path deletes and inserts per product
+            pos_links = []
+            chunk_updated = 0
+
+            for parsed in chunk:
+                row_num = parsed['row_num']
+                try:
+                    name = parsed['name']
+                    barcode = parsed['barcode']
+                    unit_cost = parsed['unit_cost']
+                    sale_price = parsed['sale_price']
+                    category_name = parsed['category_name']
+                    pos_category_name = parsed['pos_category_name']
+                    available_in_pos = True  # Default TRUE for all products
+
+                    # Get or create categories
+                    categ_id = None
+                    pos_categ_id = None
+
+                    if upd_category and category_name:
+                        categ_id = self._get_or_create_category(
+                            category_name, cache=categ_cache)
+
+                    if upd_pos_category and pos_category_name:
+                        pos_categ_id = self._get_or_create_pos_category(
+                            pos_category_name, cache=pos_categ_cache)
+
+                    existing_id = existing_map.get(barcode)
+
+                    # Skip if barcode exists and skip_existing_barcode is checked
+                    if existing_id and skip_existing:
+                        skipped += 1
+                        continue
+
+                    if existing_id:
+                        # Update existing product: always update
+                        # available_in_pos, then run the specialized steps
+                        parsed['categ_id'] = categ_id
+                        vals = {'available_in_pos': available_in_pos}
+                        for step in update_steps:
+                            step(vals, parsed)
+
+                        current = current_by_id[existing_id]
+                        link_queued = False
+                        if (upd_pos_category and pos_categ_id
+                                and current['pos_categ_ids'] != [pos_categ_id]):
+                            pos_links.append(
+                                (tmpl_by_product[existing_id], pos_categ_id))
+                            link_queued = True
+
+                        # Keep only genuine changes
+                        vals = {k: v for k, v in vals.items()
+                                if v != current.get(k)}
+                        if vals:
+                            key = frozenset((k, _freeze(v)) for k, v in vals.items())
+                            update_groups.setdefault(key, (vals, []))[1].append(
+                                existing_id)
+                            chunk_updated += 1
+                        elif link_queued:
+                            # The POS category rewrite still changes this
+                            # product, so it counts as updated
+                            chunk_updated += 1
+                        else:
+                            skipped += 1
+
+                    elif create_new:
+                        # Create new product
+                        vals = {
+                            'name': name,
+                            'barcode': barcode,
+                            'type': 'consu',
+                            'available_in_pos': available_in_pos,
+                            'description_purchase': vendor_desc,
+                        }
+
+                        if unit_cost is not None:
+                            vals['standard_price'] = unit_cost
+
+                        if sale_price is not None:
+                            vals['list_price'] = sale_price
+
+                        if categ_id:
+                            vals['categ_id'] = categ_id
+
+                        if pos_categ_id:
+                            vals['pos_categ_ids'] = pos_cmd_cache.setdefault(
+                                pos_categ_id, [(6, 0, [pos_categ_id])])
+
+                        queued = queued_by_barcode.get(barcode)
+                        if queued is not None:
+                            # Second occurrence of a new barcode within
+                            # the chunk: fold it into the queued vals,
+                            # like the old create-then-update per-row
+                            # flow, instead of queueing a duplicate
+                            # create
+                            queued.update(vals)
+                            chunk_updated += 1
+                        else:
+                            queued_by_barcode[barcode] = vals
+                            create_vals.append(vals)
                     else:
                         skipped += 1
 
-                elif self.create_new_products:
-                    # Create new product
-                    vals = {
-                        'name': name,
-                        'barcode': barcode,
-                        'type': 'consu',
-                        'available_in_pos': available_in_pos,
-                        'description_purchase': f"Vendor: {self.vendor_name}",
-                    }
-
-                    if unit_cost is not None:
-                        vals['standard_price'] = unit_cost
-
-                    if sale_price is not None:
-                        vals['list_price'] = sale_price
-
-                    if categ_id:
-                        vals['categ_id'] = categ_id
-
-                    if pos_categ_id:
-                        vals['pos_categ_ids'] = [(6, 0, [pos_categ_id])]
-
-                    ProductProduct.create(vals)
-                    created += 1
-                else:
-                    skipped += 1
+                except Exception as e:
+                    error_count += 1
+                    if len(errors) < 10:
+                        errors.append(f"Row {row_num}: {str(e)}")
 
+            # Apply the chunk's database work under a savepoint: a
+            # failure rolls back just this chunk and the import carries
+            # on with the next one instead of losing everything
+            try:
+                with self.env.cr.savepoint():
+                    # Grouped updates, one set-based write per distinct vals
+                    for vals, ids in update_groups.values():
+                        ProductProduct.browse(ids).write(vals)
+
+                    # Rewrite the POS category links with one DELETE +
+                    # one multi-VALUES INSERT on the relation table,
+                    # keeping the replace-semantics of the old per-row
+                    # (6, 0, ...) commands
+                    if pos_links:
+                        field = self.env['product.template']._fields['pos_categ_ids']
+                        self.env.flush_all()
+                        self.env.cr.execute(
+                            f'DELETE FROM "{field.relation}" WHERE "{field.column1}" IN %s',
+                            (tuple({tmpl_id for tmpl_id, _categ in pos_links}),))
+                        execute_values(
+                            self.env.cr._obj,
+                            f'INSERT INTO "{field.relation}" '
+                            f'("{field.column1}", "{field.column2}") VALUES %s '
+                            f'ON CONFLICT DO NOTHING',
+                            list(set(pos_links)))
+                        self.env['product.template'].invalidate_model(['pos_categ_ids'])
+                        ProductProduct.invalidate_model(['pos_categ_ids'])
+
+                    # Create the chunk's new products with one
+                    # multi-record create, which batches the INSERTs and
+                    # compute invalidations
+                    if create_vals:
+                        ProductProduct.create(create_vals)
+
+                    # Push the chunk's pending writes so their buffers
+                    # are freed before the next chunk starts
+                    self.env.flush_all()
             except Exception as e:
-                errors.append(f"Row {row_num}: {str(e)}")
+                error_count += 1
+                if len(errors) < 10:
+                    errors.append(
+                        f"Rows {chunk[0]['row_num']}-{chunk[-1]['row_num']}: {str(e)}")
+                continue
+            updated += chunk_updated
+            created += len(create_vals)
 
         # Build result message
         result_lines = [
@@ -251,12 +630,12 @@ class ProductImportWizard(models.TransientModel):
             f"⏭️  Rows Skipped: {skipped}",
         ]
 
-        if errors:
-            result_lines.append(f"\n❌ Errors ({len(errors)}):")
-            for error in errors[:10]:  # Show first 10 errors
+        if error_count:
+            result_lines.append(f"\n❌ Errors ({error_count}):")
+            for error in errors:
                 result_lines.append(f"   - {error}")
-            if len(errors) > 10:
-                result_lines.append(f"   ... and {len(errors) - 10} more errors")
+            if error_count > len(errors):
+                result_lines.append(f"   ... and {error_count - len(errors)} more errors")
 
         self.result_message = "\n".join(result_lines)
         self.state = 'done'